@@ -1,11 +1,12 @@
 import dataclasses
+import re
 import typing
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from collections.abc import Iterable
 from dataclasses import dataclass
 from enum import Enum
-from functools import reduce
+from operator import attrgetter
 from typing import Any
 
 import arrow
@@ -22,6 +23,8 @@ if typing.TYPE_CHECKING:
 
 log = get_logger(__name__)
 
+_get_id_and_content = attrgetter("id", "content")
+
 
 class ListType(Enum):
     """An enumeration of list types."""
@@ -132,25 +135,21 @@ class AtomicList:
         """
         if not filters:  # Nothing to action.
             return None
-        try:
-            return reduce(
-                ActionSettings.union, (filter_.actions or self.defaults.actions for filter_ in filters)
-            ).fallback_to(self.defaults.actions)
-        except TypeError:
-            # The sequence fed to reduce is empty, meaning none of the filters have actions,
-            # meaning they all use the defaults.
-            return self.defaults.actions
+        default_actions = self.defaults.actions
+        remaining_filters = iter(filters)
+        merged_actions = next(remaining_filters).actions or default_actions
+        for filter_ in remaining_filters:
+            merged_actions = merged_actions.union(filter_.actions or default_actions)
+        return merged_actions.fallback_to(default_actions)
 
     @staticmethod
     def format_messages(triggers: list[Filter], *, expand_single_filter: bool = True) -> list[str]:
         """Convert the filters into strings that can be added to the alert embed."""
-        if len(triggers) == 1 and expand_single_filter:
-            message = f"#{triggers[0].id} (`{triggers[0].content}`)"
-            if triggers[0].description:
-                message += f" - {triggers[0].description}"
-            messages = [message]
-        else:
-            messages = [f"{filter_.id} (`{filter_.content}`)" for filter_ in triggers]
+        expand_filter = len(triggers) == 1 and expand_single_filter
+        id_prefix = "#" if expand_filter else ""
+        messages = [f"{id_prefix}{id_} (`{content}`)" for id_, content in map(_get_id_and_content, triggers)]
+        if expand_filter and (description := triggers[0].description):
+            messages[0] += f" - {description}"
         return messages
 
     def __hash__(self):
@@ -227,6 +226,9 @@ class FilterList(dict[ListType, AtomicList], typing.Generic[T], FieldRequiring):
             return None
         except TypeError as e:
             log.warning(e)
+        except re.error as e:
+            # Patterns are compiled when the filter is created; skip this filter rather than failing the whole list.
+            log.warning(f"The pattern of filter #{filter_data['id']} couldn't be compiled and was skipped: {e}")
 
     def __hash__(self):
         return hash(id(self))
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 import typing
+from itertools import chain
 
 from bot.exts.filtering._filter_context import Event, FilterContext
 from bot.exts.filtering._filter_lists.filter_list import FilterList, ListType
@@ -13,7 +14,8 @@ from bot.exts.filtering._utils import clean_input
 if typing.TYPE_CHECKING:
     from bot.exts.filtering.filtering import Filtering
 
-SPOILER_RE = re.compile(r"(\|\|.+?\|\|)", re.DOTALL)
+# The lazy match stops at the first closing `||`, so at most one attempt without a closing pair scans to the end.
+SPOILER_RE = re.compile(r"\|\|.+?\|\|", re.DOTALL)
 
 
 class TokensList(FilterList[TokenFilter]):
@@ -52,23 +54,32 @@ class TokensList(FilterList[TokenFilter]):
         text = ctx.content
         if not text:
             return None, [], {}
-        if SPOILER_RE.search(text):
-            text = self._expand_spoilers(text)
-        text = clean_input(text)
+        deny_list = self[ListType.DENY]
+        if not deny_list.filters:
+            # Nothing can trigger, skip preparing the content.
+            return None, [], {ListType.DENY: []}
+        text = clean_input(self._expand_spoilers(text))
         ctx = ctx.replace(content=text)
 
-        triggers = await self[ListType.DENY].filter_list_result(ctx)
+        triggers = await deny_list.filter_list_result(ctx)
         actions = None
         messages = []
         if triggers:
-            actions = self[ListType.DENY].merge_actions(triggers)
-            messages = self[ListType.DENY].format_messages(triggers)
+            actions = deny_list.merge_actions(triggers)
+            messages = deny_list.format_messages(triggers)
         return actions, messages, {ListType.DENY: triggers}
 
     @staticmethod
     def _expand_spoilers(text: str) -> str:
-        """Return a string containing all interpretations of a spoilered message."""
-        split_text = SPOILER_RE.split(text)
-        return "".join(
-            split_text[0::2] + split_text[1::2] + split_text
-        )
+        """Return a string containing all interpretations of a spoilered message, or the message if it has none."""
+        outside_parts = []
+        spoilers = []
+        last_end = 0
+        for match in SPOILER_RE.finditer(text):
+            outside_parts.append(text[last_end:match.start()])
+            spoilers.append(match[0])
+            last_end = match.end()
+        if not spoilers:
+            return text
+        outside_parts.append(text[last_end:])
+        return "".join(chain(outside_parts, spoilers, (text,)))
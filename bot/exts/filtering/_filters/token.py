@@ -4,6 +4,7 @@ from discord.ext.commands import BadArgument
 
 from bot.exts.filtering._filter_context import FilterContext
 from bot.exts.filtering._filters.filter import Filter
+from bot.exts.filtering._settings import Defaults
 
 
 class TokenFilter(Filter):
@@ -11,11 +12,13 @@ class TokenFilter(Filter):
 
     name = "token"
 
+    def __init__(self, filter_data: dict, defaults: Defaults | None = None):
+        super().__init__(filter_data, defaults)
+        self.pattern = re.compile(self.content, flags=re.IGNORECASE)
+
     async def triggered_on(self, ctx: FilterContext) -> bool:
         """Searches for a regex pattern within a given context."""
-        pattern = self.content
-
-        match = re.search(pattern, ctx.content, flags=re.IGNORECASE)
+        match = self.pattern.search(ctx.content)
         if match:
             ctx.matches.append(match[0])
             return True
@@ -8,7 +8,7 @@ from operator import attrgetter
 from typing import NamedTuple
 
 import discord
-from bs4 import BeautifulSoup
+from bs4.element import Tag
 from pydis_core.utils import scheduling
 
 import bot
@@ -16,6 +16,7 @@ from bot.constants import Channels
 from bot.log import get_logger
 
 from . import _cog, doc_cache
+from ._html import parse_page
 from ._parsing import get_symbol_markdown
 from ._redis_cache import StaleItemCounter
 
@@ -55,10 +56,10 @@ class StaleInventoryNotifier:
 
 
 class QueueItem(NamedTuple):
-    """Contains a `DocItem` and the `BeautifulSoup` object needed to parse it."""
+    """Contains a `DocItem` and the tags of its page, mapped by their ids, needed to parse it."""
 
     doc_item: _cog.DocItem
-    soup: BeautifulSoup
+    tags_by_id: dict[str, Tag]
 
     def __eq__(self, other: QueueItem | _cog.DocItem):
         if isinstance(other, _cog.DocItem):
@@ -109,14 +110,13 @@ class BatchParser:
             self._item_futures[doc_item].user_requested = True
 
             async with bot.instance.http_session.get(doc_item.url, raise_for_status=True) as response:
-                soup = await bot.instance.loop.run_in_executor(
+                tags_by_id = await bot.instance.loop.run_in_executor(
                     None,
-                    BeautifulSoup,
+                    parse_page,
                     await response.text(encoding="utf8"),
-                    "lxml",
                 )
 
-            self._queue.extendleft(QueueItem(item, soup) for item in self._page_doc_items[doc_item.url])
+            self._queue.extendleft(QueueItem(item, tags_by_id) for item in self._page_doc_items[doc_item.url])
             log.debug(f"Added items from {doc_item.url} to the parse queue.")
 
             if self._parse_task is None:
@@ -137,7 +137,7 @@ class BatchParser:
         log.trace("Starting queue parsing.")
         try:
             while self._queue:
-                item, soup = self._queue.pop()
+                item, tags_by_id = self._queue.pop()
                 markdown = None
 
                 if (future := self._item_futures[item]).done():
@@ -146,7 +146,7 @@ class BatchParser:
                     continue
 
                 try:
-                    markdown = await bot.instance.loop.run_in_executor(None, get_symbol_markdown, soup, item)
+                    markdown = await bot.instance.loop.run_in_executor(None, get_symbol_markdown, tags_by_id, item)
                     if markdown is not None:
                         await doc_cache.set(item, markdown)
                     else:
@@ -165,7 +165,7 @@ class BatchParser:
 
     def _move_to_front(self, item: QueueItem | _cog.DocItem) -> None:
         """Move `item` to the front of the parse queue."""
-        # The parse queue stores soups along with the doc symbols in QueueItem objects,
+        # The parse queue stores page tags along with the doc symbols in QueueItem objects,
         # in case we're moving a DocItem we have to get the associated QueueItem first and then move it.
         item_index = self._queue.index(item)
         queue_item = self._queue[item_index]
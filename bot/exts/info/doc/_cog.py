@@ -3,7 +3,8 @@ from __future__ import annotations
 import asyncio
 import sys
 import textwrap
-from collections import defaultdict
+import time
+from collections import OrderedDict, defaultdict
 from contextlib import suppress
 from types import SimpleNamespace
 from typing import Literal, NamedTuple
@@ -39,6 +40,8 @@ FORCE_PREFIX_GROUPS = (
 NOT_FOUND_DELETE_DELAY = RedirectOutput.delete_delay
 # Delay to wait before trying to reach a rescheduled inventory again, in minutes
 FETCH_RESCHEDULE_DELAY = SimpleNamespace(first=2, repeated=5)
+# Amount of recently requested symbols to keep the Markdown of in memory
+MARKDOWN_CACHE_SIZE = 1024
 
 COMMAND_LOCK_SINGLETON = "inventory refresh"
 
@@ -70,6 +73,9 @@ class DocCog(commands.Cog):
         self.item_fetcher = _batch_parser.BatchParser()
         # Maps a conflicting symbol name to a list of the new, disambiguated names created from conflicts with the name.
         self.renamed_symbols = defaultdict(list)
+        # Holds the Markdown of recently requested symbols, skipping the redis lookup when they're requested again.
+        # Entries are stored with the monotonic time at which the redis key they were read from expires.
+        self.symbol_markdown_cache: OrderedDict[DocItem, tuple[float, str]] = OrderedDict()
 
         self.inventory_scheduler = Scheduler(self.__class__.__name__)
 
@@ -213,6 +219,7 @@ class DocCog(commands.Cog):
         self.base_urls.clear()
         self.doc_symbols.clear()
         self.renamed_symbols.clear()
+        self.symbol_markdown_cache.clear()
         await self.item_fetcher.clear()
 
         coros = [
@@ -242,9 +249,16 @@ class DocCog(commands.Cog):
         """
         Get the Markdown from the symbol `doc_item` refers to.
 
-        First a redis lookup is attempted, if that fails the `item_fetcher`
-        is used to fetch the page and parse the HTML from it into Markdown.
+        First the in memory cache of recently requested symbols is checked, followed by a redis lookup.
+        If both fail, the `item_fetcher` is used to fetch the page and parse the HTML from it into Markdown.
         """
+        if (cached := self.symbol_markdown_cache.get(doc_item)) is not None:
+            expires_at, markdown = cached
+            if time.monotonic() < expires_at:
+                self.symbol_markdown_cache.move_to_end(doc_item)
+                return markdown
+            del self.symbol_markdown_cache[doc_item]
+
         markdown = await doc_cache.get(doc_item)
 
         if markdown is None:
@@ -262,6 +276,12 @@ class DocCog(commands.Cog):
 
             if markdown is None:
                 return "Unable to parse the requested symbol."
+
+        # Only keep the Markdown in memory while it's in redis, so the page gets parsed again once the key expires.
+        if (ttl := await doc_cache.ttl(doc_item)) > 0:
+            self.symbol_markdown_cache[doc_item] = (time.monotonic() + ttl, markdown)
+            if len(self.symbol_markdown_cache) > MARKDOWN_CACHE_SIZE:
+                self.symbol_markdown_cache.popitem(last=False)
         return markdown
 
     async def create_symbol_embed(self, symbol_name: str) -> discord.Embed | None:
@@ -452,6 +472,12 @@ class DocCog(commands.Cog):
         package_name: PackageName | Literal["*"]
     ) -> None:
         """Clear the persistent redis cache for `package`."""
+        if package_name == "*":
+            self.symbol_markdown_cache.clear()
+        else:
+            for doc_item in [item for item in self.symbol_markdown_cache if item.package == package_name]:
+                del self.symbol_markdown_cache[doc_item]
+
         if await doc_cache.delete(package_name):
             await self.item_fetcher.stale_inventory_notifier.symbol_counter.delete(package_name)
             await ctx.send(f"Successfully cleared the cache for `{package_name}`.")
@@ -1,5 +1,6 @@
-from collections.abc import Callable, Container, Iterable
+from collections.abc import Callable, Container, Iterable, Iterator
 from functools import partial
+from operator import attrgetter
 
 from bs4 import BeautifulSoup
 from bs4.element import NavigableString, PageElement, SoupStrainer, Tag
@@ -10,7 +11,7 @@ from . import MAX_SIGNATURE_AMOUNT
 
 log = get_logger(__name__)
 
-_SEARCH_END_TAG_ATTRS = (
+_SEARCH_END_TAG_ATTRS = frozenset({
     "data",
     "function",
     "class",
@@ -19,36 +20,34 @@ _SEARCH_END_TAG_ATTRS = (
     "section",
     "rubric",
     "sphinxsidebar",
-)
+})
+_DD_END_TAG_NAMES = frozenset({"dt", "dl"})
+_SIGNATURE_END_TAG_NAMES = frozenset({"dd"})
+# Only the document body can contain symbols, skip building the tree for scripts, styles and metadata in the head.
+_PAGE_STRAINER = SoupStrainer("body")
 
 
-class Strainer(SoupStrainer):
-    """Subclass of SoupStrainer to allow matching of both `Tag`s and `NavigableString`s."""
-
-    def __init__(self, *, include_strings: bool, **kwargs):
-        self.include_strings = include_strings
-        passed_text = kwargs.pop("text", None)
-        if passed_text is not None:
-            log.warning("`text` is not a supported kwarg in the custom strainer.")
-        super().__init__(**kwargs)
-
-    Markup = PageElement | list["Markup"]
+def parse_page(html: str) -> dict[str, Tag]:
+    """
+    Parse the `html` of a documentation page into a dict mapping the ids of its tags to the tags.
 
-    def search(self, markup: Markup) -> PageElement | str:
-        """Extend default SoupStrainer behaviour to allow matching both `Tag`s` and `NavigableString`s."""
-        if isinstance(markup, str):
-            # Let everything through the text filter if we're including strings and tags.
-            if not self.name and not self.attrs and self.include_strings:
-                return markup
-            return None
-        return super().search(markup)
+    Only the tree for the contents of the body is built.
+    The ids are collected in a single walk through the page, instead of searching the whole tree for every symbol;
+    if an id is repeated the first tag with it is used, same as with `BeautifulSoup.find`.
+    """
+    soup = BeautifulSoup(html, "lxml", parse_only=_PAGE_STRAINER)
+    tags_by_id = {}
+    for element in soup.descendants:
+        if isinstance(element, Tag) and (tag_id := element.get("id")) is not None:
+            tags_by_id.setdefault(tag_id, element)
+    return tags_by_id
 
 
 def _find_elements_until_tag(
     start_element: PageElement,
     end_tag_filter: Container[str] | Callable[[Tag], bool],
     *,
-    func: Callable,
+    func: Callable[[PageElement], Iterator[PageElement]],
     include_strings: bool = False,
     limit: int | None = None,
 ) -> list[Tag | NavigableString]:
@@ -60,41 +59,53 @@ def _find_elements_until_tag(
 
     When `include_strings` is True, `NavigableString`s from the document will be included in the result along `Tag`s.
 
-    `func` takes in a BeautifulSoup unbound method for finding multiple elements, such as `BeautifulSoup.find_all`.
-    The method is then iterated over and all elements until the matching tag or the limit are added to the return list.
+    `func` takes in the start element and returns an iterator over the elements to search, such as its next siblings.
+    The elements are iterated over directly instead of going through bs4's `find_*` methods,
+    which would run a `SoupStrainer` on every visited element.
     """
     use_container_filter = not callable(end_tag_filter)
     elements = []
 
-    for element in func(start_element, name=Strainer(include_strings=include_strings), limit=limit):
+    for element in func(start_element):
         if isinstance(element, Tag):
             if use_container_filter:
                 if element.name in end_tag_filter:
                     break
             elif end_tag_filter(element):
                 break
+        elif not include_strings:
+            continue
         elements.append(element)
+        if len(elements) == limit:
+            break
 
     return elements
 
 
-_find_next_children_until_tag = partial(_find_elements_until_tag, func=partial(BeautifulSoup.find_all, recursive=False))
-_find_recursive_children_until_tag = partial(_find_elements_until_tag, func=BeautifulSoup.find_all)
-_find_next_siblings_until_tag = partial(_find_elements_until_tag, func=BeautifulSoup.find_next_siblings)
-_find_previous_siblings_until_tag = partial(_find_elements_until_tag, func=BeautifulSoup.find_previous_siblings)
+_find_next_children_until_tag = partial(_find_elements_until_tag, func=attrgetter("children"))
+_find_recursive_children_until_tag = partial(_find_elements_until_tag, func=attrgetter("descendants"))
+_find_next_siblings_until_tag = partial(_find_elements_until_tag, func=attrgetter("next_siblings"))
+_find_previous_siblings_until_tag = partial(_find_elements_until_tag, func=attrgetter("previous_siblings"))
 
 
 def _class_filter_factory(class_names: Iterable[str]) -> Callable[[Tag], bool]:
     """Create callable that returns True when the passed in tag's class is in `class_names` or when it's a table."""
+    class_names = frozenset(class_names)
+
     def match_tag(tag: Tag) -> bool:
-        for attr in class_names:
-            if attr in tag.get("class", ()):
-                return True
+        tag_classes = tag.get("class")
+        if tag_classes is not None and not class_names.isdisjoint(tag_classes):
+            return True
         return tag.name == "table"
 
     return match_tag
 
 
+_match_end_tag = _class_filter_factory(_SEARCH_END_TAG_ATTRS)
+_match_section_tag = _class_filter_factory(["section"])
+_match_headerlink_tag = _class_filter_factory(["headerlink"])
+
+
 def get_general_description(start_element: Tag) -> list[Tag | NavigableString]:
     """
     Get page content to a table or a tag with its class in `SEARCH_END_TAG_ATTRS`.
@@ -102,16 +113,16 @@ def get_general_description(start_element: Tag) -> list[Tag | NavigableString]:
     A headerlink tag is attempted to be found to skip repeating the symbol information in the description.
     If it's found it's used as the tag to start the search from instead of the `start_element`.
     """
-    child_tags = _find_recursive_children_until_tag(start_element, _class_filter_factory(["section"]), limit=100)
-    header = next(filter(_class_filter_factory(["headerlink"]), child_tags), None)
+    child_tags = _find_recursive_children_until_tag(start_element, _match_section_tag, limit=100)
+    header = next(filter(_match_headerlink_tag, child_tags), None)
     start_tag = header.parent if header is not None else start_element
-    return _find_next_siblings_until_tag(start_tag, _class_filter_factory(_SEARCH_END_TAG_ATTRS), include_strings=True)
+    return _find_next_siblings_until_tag(start_tag, _match_end_tag, include_strings=True)
 
 
 def get_dd_description(symbol: PageElement) -> list[Tag | NavigableString]:
     """Get the contents of the next dd tag, up to a dt or a dl tag."""
     description_tag = symbol.find_next("dd")
-    return _find_next_children_until_tag(description_tag, ("dt", "dl"), include_strings=True)
+    return _find_next_children_until_tag(description_tag, _DD_END_TAG_NAMES, include_strings=True)
 
 
 def get_signatures(start_signature: PageElement) -> list[str]:
@@ -123,14 +134,16 @@ def get_signatures(start_signature: PageElement) -> list[str]:
     """
     signatures = []
     for element in (
-            *reversed(_find_previous_siblings_until_tag(start_signature, ("dd",), limit=2)),
+            *reversed(_find_previous_siblings_until_tag(start_signature, _SIGNATURE_END_TAG_NAMES, limit=2)),
             start_signature,
-            *_find_next_siblings_until_tag(start_signature, ("dd",), limit=2),
+            *_find_next_siblings_until_tag(start_signature, _SIGNATURE_END_TAG_NAMES, limit=2),
     )[-MAX_SIGNATURE_AMOUNT:]:
-        for tag in element.find_all(_filter_signature_links, recursive=False):
-            tag.decompose()
-
-        signature = element.text
+        # Skip over the headerlink and source links instead of decomposing them, the tree is shared with other symbols.
+        signature = "".join(
+            child.text
+            for child in element.children
+            if not (isinstance(child, Tag) and _filter_signature_links(child))
+        )
         if signature:
             signatures.append(signature)
 
@@ -7,6 +7,8 @@ from bs4.element import PageElement
 # See https://github.com/matthewwithanm/python-markdownify/issues/31
 markdownify.whitespace_re = re.compile(r"[\r\n\s\t ]+")
 
+_CODE_TAG_NAMES = frozenset({"code", "kbd", "samp"})
+
 
 class DocMarkdownConverter(markdownify.MarkdownConverter):
     """Subclass markdownify's MarkdownCoverter to provide custom conversion methods."""
@@ -15,6 +17,35 @@ class DocMarkdownConverter(markdownify.MarkdownConverter):
         super().__init__(**options)
         self.page_url = page_url
 
+    def process_text(self, el: PageElement) -> str:
+        """
+        Normalize and escape the text of `el` unless it's in a preformatted or code tag.
+
+        Same as markdownify's implementation, but the parents are checked in one walk
+        instead of two `find_parent` searches for every text element.
+        """
+        text = str(el)
+
+        in_pre = in_code = False
+        parent = el.parent
+        while parent is not None:
+            if parent.name == "pre":
+                in_pre = in_code = True
+                break
+            if parent.name in _CODE_TAG_NAMES:
+                in_code = True
+            parent = parent.parent
+
+        if not in_pre:
+            text = markdownify.whitespace_re.sub(" ", text)
+        if not in_code:
+            text = self.escape(text)
+
+        # Remove trailing whitespace if the element is the last in a li tag, or is followed by an embedded list.
+        if el.parent.name == "li" and (not el.next_sibling or el.next_sibling.name in ("ul", "ol")):
+            text = text.rstrip()
+        return text
+
     def convert_li(self, el: PageElement, text: str, convert_as_inline: bool) -> str:
         """Fix markdownify's erroneous indexing in ol tags."""
         parent = el.parent
@@ -47,7 +78,9 @@ class DocMarkdownConverter(markdownify.MarkdownConverter):
         return f"```py\n{code}```"
 
     def convert_a(self, el: PageElement, text: str, convert_as_inline: bool) -> str:
-        """Resolve relative URLs to `self.page_url`."""
+        """Resolve relative URLs to `self.page_url`, and remove the ¶ headerlinks."""
+        if "headerlink" in el.get("class", ()):
+            return ""
         el["href"] = urljoin(self.page_url, el["href"])
         # Discord doesn't handle titles properly, showing links with them as raw text.
         el["title"] = None
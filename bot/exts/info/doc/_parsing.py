@@ -2,12 +2,12 @@ from __future__ import annotations
 
 import re
 import string
-import textwrap
+from bisect import bisect_left
 from collections import namedtuple
-from collections.abc import Collection, Iterable, Iterator
+from collections.abc import Collection, Iterable, Iterator, Mapping
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
-from bs4 import BeautifulSoup
 from bs4.element import NavigableString, Tag
 
 from bot.log import get_logger
@@ -22,7 +22,6 @@ if TYPE_CHECKING:
 
 log = get_logger(__name__)
 
-_WHITESPACE_AFTER_NEWLINES_RE = re.compile(r"(?<=\n\n)(\s+)")
 _PARAMETERS_RE = re.compile(r"\((.+)\)")
 
 _NO_SIGNATURE_GROUPS = {
@@ -113,7 +112,11 @@ def _truncate_signatures(signatures: Collection[str]) -> list[str] | Collection[
         if len(signature) > max_signature_length:
             if (parameters_match := _PARAMETERS_RE.search(signature)) is None:
                 # The signature has no parameters or the regex failed; perform a simple truncation of the text.
-                formatted_signatures.append(textwrap.shorten(signature, max_signature_length, placeholder="..."))
+                # Collapse whitespace first so the signature stays on a single line like the length limit assumes.
+                signature = " ".join(signature.split())
+                if len(signature) > max_signature_length:
+                    signature = signature[:max_signature_length - 3].rstrip() + "..."
+                formatted_signatures.append(signature)
                 continue
 
             truncated_signature = []
@@ -136,6 +139,20 @@ def _truncate_signatures(signatures: Collection[str]) -> list[str] | Collection[
     return formatted_signatures
 
 
+def _remove_whitespace_after_newlines(text: str) -> str:
+    """Remove all whitespace following two consecutive newlines in `text`."""
+    parts = []
+    part_start = 0
+    while (newlines_index := text.find("\n\n", part_start)) != -1:
+        whitespace_start = newlines_index + 2
+        parts.append(text[part_start:whitespace_start])
+        part_start = whitespace_start
+        while part_start < len(text) and text[part_start].isspace():
+            part_start += 1
+    parts.append(text[part_start:])
+    return "".join(parts)
+
+
 def _get_truncated_description(
     elements: Iterable[Tag | NavigableString],
     markdown_converter: DocMarkdownConverter,
@@ -151,17 +168,24 @@ def _get_truncated_description(
     result = ""
     markdown_element_ends = []  # Stores indices into `result` which point to the end boundary of each Markdown element.
     rendered_length = 0
+    shortened = False  # Whether elements were left out because they didn't fit within `max_length`.
 
     tag_end_index = 0
     for element in elements:
         is_tag = isinstance(element, Tag)
-        element_length = len(element.text) if is_tag else len(element)
+        # Sum the lengths of the strings instead of joining them all through `element.text` only to get its length.
+        element_length = sum(map(len, element.strings)) if is_tag else len(element)
 
         if rendered_length + element_length < max_length:
             if is_tag:
                 element_markdown = markdown_converter.process_tag(element, convert_as_inline=False)
             else:
                 element_markdown = markdown_converter.process_text(element)
+            # Include the end of the previous element to also catch newlines spanning across the two elements.
+            preceding_markdown = result[-2:]
+            element_markdown = _remove_whitespace_after_newlines(
+                preceding_markdown + element_markdown
+            )[len(preceding_markdown):]
 
             rendered_length += element_length
             tag_end_index += len(element_markdown)
@@ -170,6 +194,7 @@ def _get_truncated_description(
                 markdown_element_ends.append(tag_end_index)
             result += element_markdown
         else:
+            shortened = True
             break
 
     if not markdown_element_ends:
@@ -186,11 +211,13 @@ def _get_truncated_description(
 
     # Nothing needs to be truncated if the last element ends before the truncation index.
     if truncate_index >= markdown_element_ends[-1]:
+        if shortened:
+            return result.strip(_TRUNCATE_STRIP_CHARACTERS) + "..."
         return result
 
-    # Determine the actual truncation index.
-    possible_truncation_indices = [cut for cut in markdown_element_ends if cut < truncate_index]
-    if not possible_truncation_indices:
+    # Determine the actual truncation index. The element ends are ascending, so they can be bisected.
+    possible_truncation_amount = bisect_left(markdown_element_ends, truncate_index)
+    if not possible_truncation_amount:
         # In case there is no Markdown element ending before the truncation index, try to find a good cutoff point.
         force_truncated = result[:truncate_index]
         # If there is an incomplete codeblock, cut it out.
@@ -208,12 +235,22 @@ def _get_truncated_description(
 
     else:
         # Truncate at the last Markdown element that comes before the truncation index.
-        markdown_truncate_index = possible_truncation_indices[-1]
+        markdown_truncate_index = markdown_element_ends[possible_truncation_amount - 1]
         truncated_result = result[:markdown_truncate_index]
 
     return truncated_result.strip(_TRUNCATE_STRIP_CHARACTERS) + "..."
 
 
+@lru_cache(maxsize=128)
+def _get_markdown_converter(url: str) -> DocMarkdownConverter:
+    """
+    Get a Markdown converter resolving relative links to `url`.
+
+    The converter holds no state between conversions so it's reused for all the symbols on the same page.
+    """
+    return DocMarkdownConverter(bullets="•", page_url=url)
+
+
 def _create_markdown(signatures: list[str] | None, description: Iterable[Tag], url: str) -> str:
     """
     Create a Markdown string with the signatures at the top, and the converted html description below them.
@@ -223,24 +260,29 @@ def _create_markdown(signatures: list[str] | None, description: Iterable[Tag], u
     """
     description = _get_truncated_description(
         description,
-        markdown_converter=DocMarkdownConverter(bullets="•", page_url=url),
+        markdown_converter=_get_markdown_converter(url),
         max_length=750,
         max_lines=13
     )
-    description = _WHITESPACE_AFTER_NEWLINES_RE.sub("", description)
-    if signatures is not None:
-        signature = "".join(f"```py\n{signature}```" for signature in _truncate_signatures(signatures))
-        return f"{signature}\n{description}"
-    return description
+    if signatures is None:
+        return description
+
+    markdown_parts = []
+    for signature in _truncate_signatures(signatures):
+        markdown_parts += ("```py\n", signature, "```")
+    markdown_parts += ("\n", description)
+    return "".join(markdown_parts)
 
 
-def get_symbol_markdown(soup: BeautifulSoup, symbol_data: DocItem) -> str | None:
+def get_symbol_markdown(tags_by_id: Mapping[str, Tag], symbol_data: DocItem) -> str | None:
     """
-    Return parsed Markdown of the passed item using the passed in soup, truncated to fit within a discord message.
+    Return parsed Markdown of the passed item using its page's tags, truncated to fit within a discord message.
+
+    `tags_by_id` maps the ids of the tags on the item's page to the tags, as returned by `parse_page`.
 
     The method of parsing and what information gets included depends on the symbol's group.
     """
-    symbol_heading = soup.find(id=symbol_data.symbol_id)
+    symbol_heading = tags_by_id.get(symbol_data.symbol_id)
     if symbol_heading is None:
         return None
     signature = None
@@ -256,9 +298,4 @@ def get_symbol_markdown(soup: BeautifulSoup, symbol_data: DocItem) -> str | None
         signature = get_signatures(symbol_heading)
         description = get_dd_description(symbol_heading)
 
-    for description_element in description:
-        if isinstance(description_element, Tag):
-            for tag in description_element.find_all("a", class_="headerlink"):
-                tag.decompose()
-
     return _create_markdown(signature, description, symbol_data.url).strip()
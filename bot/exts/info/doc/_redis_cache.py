@@ -70,6 +70,10 @@ class DocRedisCache(RedisObject):
         """Return the Markdown content of the symbol `item` if it exists."""
         return await self.redis_session.client.hget(f"{self.namespace}:{item_key(item)}", item.symbol_id)
 
+    async def ttl(self, item: DocItem) -> int:
+        """Return the seconds until the key holding `item` expires, negative if it doesn't exist or has no expire."""
+        return await self.redis_session.client.ttl(f"{self.namespace}:{item_key(item)}")
+
     async def delete(self, package: str) -> bool:
         """Remove all values for `package`; return True if at least one key was deleted, False otherwise."""
         pattern = f"{self.namespace}:{package}:*"
@@ -0,0 +1,57 @@
+import unittest
+from unittest.mock import MagicMock
+
+import arrow
+
+from bot.exts.filtering._filter_lists.token import TokensList
+
+
+class ExpandSpoilersTests(unittest.TestCase):
+    """Test the expansion of spoilered messages for the token filters."""
+
+    def test_expand_spoilers(self):
+        """The outside text, the spoilers, and the original message should be concatenated in that order."""
+        test_cases = (
+            ("no spoilers", "no spoilers"),
+            ("||lone||", "||lone||||lone||"),
+            ("a ||b|| c", "a  c||b||a ||b|| c"),
+            ("a ||b|| c ||d\ne|| f", "a  c  f||b||||d\ne||a ||b|| c ||d\ne|| f"),
+            ("unclosed ||spoiler", "unclosed ||spoiler"),
+        )
+
+        for text, expected in test_cases:
+            with self.subTest(text=text):
+                self.assertEqual(TokensList._expand_spoilers(text), expected)
+
+
+class TokensListLoadingTests(unittest.TestCase):
+    """Test the loading of token filters into the list."""
+
+    def test_invalid_pattern_skipped(self):
+        """A filter with a pattern that doesn't compile should be skipped without failing the rest of the list."""
+        now = arrow.utcnow().timestamp()
+        filters = [
+            {
+                "id": filter_id,
+                "content": content,
+                "description": None,
+                "settings": {},
+                "additional_settings": {},
+                "created_at": now,
+                "updated_at": now,
+            }
+            for filter_id, content in ((1, "valid"), (2, "(unclosed"), (3, "also (?i)valid"), (4, r"\d+"))
+        ]
+        tokens_list = TokensList(MagicMock())
+
+        with self.assertLogs("bot.exts.filtering._filter_lists.filter_list", level="WARNING"):
+            atomic_list = tokens_list.add_list({
+                "id": 1,
+                "created_at": now,
+                "updated_at": now,
+                "list_type": 0,
+                "settings": {},
+                "filters": filters,
+            })
+
+        self.assertEqual(list(atomic_list.filters), [1, 4])
@@ -0,0 +1,85 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from bot.exts.info.doc import _cog
+from bot.exts.info.doc._cog import DocCog, DocItem
+from tests.helpers import MockBot, MockContext
+
+
+def make_item(package: str, symbol_id: str) -> DocItem:
+    return DocItem(package, "function", "https://example.com/", "index.html", symbol_id)
+
+
+class SymbolMarkdownCacheTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for the in-memory cache of recently requested symbol Markdown."""
+
+    def setUp(self):
+        batch_parser_patcher = patch("bot.exts.info.doc._cog._batch_parser.BatchParser")
+        self.item_fetcher = batch_parser_patcher.start().return_value
+        self.item_fetcher.get_markdown = AsyncMock(return_value="parsed")
+        self.item_fetcher.stale_inventory_notifier.symbol_counter.delete = AsyncMock()
+        self.addCleanup(batch_parser_patcher.stop)
+
+        doc_cache_patcher = patch("bot.exts.info.doc._cog.doc_cache")
+        self.doc_cache = doc_cache_patcher.start()
+        self.doc_cache.get = AsyncMock(return_value="markdown")
+        self.doc_cache.ttl = AsyncMock(return_value=60)
+        self.doc_cache.delete = AsyncMock(return_value=True)
+        self.addCleanup(doc_cache_patcher.stop)
+
+        self.cog = DocCog(MockBot())
+
+    async def test_cached_markdown_skips_redis(self):
+        """A symbol requested again is returned from memory without querying redis."""
+        item = make_item("foo", "a")
+
+        self.assertEqual(await self.cog.get_symbol_markdown(item), "markdown")
+        self.assertEqual(await self.cog.get_symbol_markdown(item), "markdown")
+        self.doc_cache.get.assert_awaited_once_with(item)
+
+    async def test_least_recently_used_entry_evicted(self):
+        """The least recently requested symbol is evicted once the cache holds more than `MARKDOWN_CACHE_SIZE`."""
+        first, second, third = (make_item("foo", symbol_id) for symbol_id in "abc")
+
+        with patch.object(_cog, "MARKDOWN_CACHE_SIZE", 2):
+            await self.cog.get_symbol_markdown(first)
+            await self.cog.get_symbol_markdown(second)
+            await self.cog.get_symbol_markdown(first)
+            await self.cog.get_symbol_markdown(third)
+
+        self.assertEqual(list(self.cog.symbol_markdown_cache), [first, third])
+
+    async def test_expired_entry_refetched(self):
+        """An entry is fetched again once the redis key it was read from has expired."""
+        item = make_item("foo", "a")
+        monotonic = MagicMock(return_value=1000)
+
+        with patch.object(_cog.time, "monotonic", monotonic):
+            await self.cog.get_symbol_markdown(item)
+            monotonic.return_value = 1059
+            await self.cog.get_symbol_markdown(item)
+            self.doc_cache.get.assert_awaited_once()
+
+            monotonic.return_value = 1060
+            await self.cog.get_symbol_markdown(item)
+            self.assertEqual(self.doc_cache.get.await_count, 2)
+
+    async def test_not_cached_without_redis_expiry(self):
+        """Markdown is not kept in memory when its redis key is missing or has no expiry."""
+        for ttl in (-2, -1):
+            with self.subTest(ttl=ttl):
+                self.doc_cache.ttl.return_value = ttl
+                await self.cog.get_symbol_markdown(make_item("foo", "a"))
+                self.assertFalse(self.cog.symbol_markdown_cache)
+
+    async def test_clear_cache_only_clears_package(self):
+        """Clearing the cache of a package leaves the entries of other packages in memory."""
+        foo_item = make_item("foo", "a")
+        bar_item = make_item("bar", "a")
+        await self.cog.get_symbol_markdown(foo_item)
+        await self.cog.get_symbol_markdown(bar_item)
+
+        await self.cog.clear_cache_command.callback(self.cog, MockContext(), "foo")
+
+        self.assertEqual(list(self.cog.symbol_markdown_cache), [bar_item])
+        self.doc_cache.delete.assert_awaited_once_with("foo")
@@ -1,5 +1,7 @@
 from unittest import TestCase
 
+from bs4 import BeautifulSoup
+
 from bot.exts.info.doc import _parsing as parsing
 from bot.exts.info.doc._markdown import DocMarkdownConverter
 
@@ -67,6 +69,82 @@ class SignatureSplitter(TestCase):
                 self.assertEqual(list(parsing._split_parameters(input_string)), expected_output)
 
 
+class SignatureTruncationTests(TestCase):
+    def test_short_signatures_unchanged(self):
+        signatures = ["foo(a, b)", "bar()"]
+        self.assertEqual(parsing._truncate_signatures(signatures), signatures)
+
+    def test_signature_without_parameters_truncated(self):
+        signatures = ["a" * 100] * 3
+        truncated_signature = "a" * 58 + "..."
+        self.assertEqual(parsing._truncate_signatures(signatures), [truncated_signature] * 3)
+
+    def test_truncated_signature_whitespace_collapsed(self):
+        signatures = ["a\n    " * 40] * 3
+        truncated_signature = "a " * 28 + "a..."
+        self.assertEqual(parsing._truncate_signatures(signatures), [truncated_signature] * 3)
+
+    def test_signature_fitting_after_whitespace_collapse_not_truncated(self):
+        signatures = ["foo" + " " * 30 + "\n" + " " * 40 + "bar"] * 3
+        self.assertEqual(parsing._truncate_signatures(signatures), ["foo bar"] * 3)
+
+    def test_multiline_signature_fitting_after_whitespace_collapse_not_truncated(self):
+        signatures = ["func(\n" + " " * 40 + "a: int,\n" + " " * 40 + "b: str,\n)"] * 3
+        self.assertEqual(parsing._truncate_signatures(signatures), ["func( a: int, b: str, )"] * 3)
+
+    def test_truncated_signature_cut_at_space(self):
+        signatures = ["a" * 57 + " " + "b" * 50] * 3
+        truncated_signature = "a" * 57 + "..."
+        self.assertEqual(parsing._truncate_signatures(signatures), [truncated_signature] * 3)
+
+
+class TruncatedDescriptionTests(TestCase):
+    def test_elements_over_max_length_marked_with_ellipsis(self):
+        elements = self._get_elements(f"<p>Lead in:</p><p>{'a' * 100}</p>")
+        self.assertEqual(self._truncate(elements), "Lead in...")
+
+    def test_elements_within_max_length_kept(self):
+        elements = self._get_elements("<p>Lead in:</p><p>short</p>")
+        self.assertEqual(self._truncate(elements), "Lead in:\n\nshort\n\n")
+
+    @staticmethod
+    def _get_elements(html: str) -> list:
+        return list(BeautifulSoup(f"<div>{html}</div>", "lxml").div.children)
+
+    @staticmethod
+    def _truncate(elements: list) -> str:
+        return parsing._get_truncated_description(
+            elements,
+            DocMarkdownConverter(page_url="https://example.com"),
+            max_length=50,
+            max_lines=13,
+        )
+
+
+class WhitespaceAfterNewlinesTests(TestCase):
+    def test_whitespace_removed(self):
+        test_cases = (
+            ("text\n\n   text", "text\n\ntext"),
+            ("text\n\n\n\n\ttext", "text\n\ntext"),
+            ("text\n\n \n\n text\n\n  text", "text\n\ntext\n\ntext"),
+            ("text\n\n  ", "text\n\n"),
+        )
+        self._run_tests(test_cases)
+
+    def test_other_whitespace_kept(self):
+        test_cases = (
+            ("text", "text"),
+            ("text\n  text", "text\n  text"),
+            ("  text \n text  ", "  text \n text  "),
+        )
+        self._run_tests(test_cases)
+
+    def _run_tests(self, test_cases: tuple[tuple[str, str], ...]):
+        for input_string, expected_output in test_cases:
+            with self.subTest(input_string=input_string):
+                self.assertEqual(parsing._remove_whitespace_after_newlines(input_string), expected_output)
+
+
 class MarkdownConverterTest(TestCase):
     def test_hr_removed(self):
         test_cases = (
@@ -82,6 +160,14 @@ class MarkdownConverterTest(TestCase):
         )
         self._run_tests(test_cases)
 
+    def test_headerlink_removed(self):
+        test_cases = (
+            ('<a class="headerlink" href="#title">¶</a>', ""),
+            ('<h2>Title<a class="headerlink" href="#title">¶</a></h2>', "**Title**\n\n"),
+            ('<a href="#title">link</a>', "[link](https://example.com#title)"),
+        )
+        self._run_tests(test_cases)
+
     def _run_tests(self, test_cases: tuple[tuple[str, str], ...]):
         for input_string, expected_output in test_cases:
             with self.subTest(input_string=input_string):